@@ -33,8 +33,7 @@ internal sealed record ReportInterpreterOptions(
                 return false;
             }
 
-            var key = rawArg[2..];
-            switch (key)
+            switch (rawArg.AsSpan(2))
             {
                 case "run-id":
                     {
@@ -113,7 +112,7 @@ internal sealed record ReportInterpreterOptions(
                     }
 
                 default:
-                    error = $"Unknown option '--{key}'.";
+                    error = $"Unknown option '{rawArg}'.";
                     return false;
             }
         }
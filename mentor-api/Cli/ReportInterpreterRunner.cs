@@ -1,6 +1,9 @@
+using System.Buffers;
+using System.Globalization;
 using System.Net;
 using System.Net.Http;
 using System.Net.Http.Headers;
+using System.Security.Cryptography;
 using System.Text;
 using System.Text.Json;
 using System.Text.Json.Nodes;
@@ -9,19 +12,37 @@ namespace MentorTrainingRunner;
 
 internal sealed class ReportInterpreterRunner
 {
+    private static readonly JsonWriterOptions IndentedWriterOptions = new() { Indented = true };
+    private static readonly JsonSerializerOptions IndentedSerializerOptions = new() { WriteIndented = true };
+    private static readonly Uri ChatCompletionsUri = new("https://api.openai.com/v1/chat/completions");
+    private static readonly HttpClient SharedHttpClient = CreateHttpClient();
+    private static readonly SemaphoreSlim OpenAiConcurrency = CreateConcurrencyGate();
+    private static readonly Lazy<string?> EnvironmentApiKey = new(() => Environment.GetEnvironmentVariable("OPENAI_API_KEY"));
     private readonly ReportInterpreterOptions options;
     private readonly TextWriter outputWriter;
     private readonly TextWriter errorWriter;
+    private readonly Stream? standardOutput;
     private const int MaxRetries = 3;
+    private const int MaxRetryJitterMilliseconds = 250;
+    private const int MaxErrorBodyBytes = 4096;
+    private const int MaxPromptArrayItems = 20;
+    private const int PromptArrayHeadItems = 10;
+    private const int PromptArrayTailItems = 5;
+    private static readonly TimeSpan InitialRetryDelay = TimeSpan.FromSeconds(1);
+    private static readonly TimeSpan MaxRetryDelay = TimeSpan.FromSeconds(30);
+    private const string SystemPrompt = "You are the Report Interpreter Agent for Mentor CLI runs. Given the JSON payload, explain the current results concisely: identify run-id, missing artifacts, summarize training_status checkpoints/metadata, timers highlights, and configuration notes. Keep it short and actionable.";
 
     public ReportInterpreterRunner(
         ReportInterpreterOptions options,
         TextWriter? outputWriter = null,
-        TextWriter? errorWriter = null)
+        TextWriter? errorWriter = null,
+        Stream? standardOutput = null)
     {
         this.options = options;
         this.outputWriter = outputWriter ?? Console.Out;
         this.errorWriter = errorWriter ?? Console.Error;
+        // Only bypass the text writer for the process stdout; an injected writer receives the JSON like every other line.
+        this.standardOutput = standardOutput ?? (outputWriter is null ? Console.OpenStandardOutput() : null);
     }
 
     public async Task<int> RunAsync(CancellationToken cancellationToken = default)
@@ -61,7 +82,7 @@ internal sealed class ReportInterpreterRunner
 
         try
         {
-            var completion = await CallOpenAiWithRetryAsync(apiKey, payload, options.Prompt, cancellationToken);
+            var completion = await CallOpenAiCachedAsync(apiKey, payload, options.Prompt, cancellationToken);
             EmitPayload(payload, completion);
             return 0;
         }
@@ -113,7 +134,7 @@ internal sealed class ReportInterpreterRunner
 
     private string? ResolveApiKey()
     {
-        return options.OpenAiApiKey ?? Environment.GetEnvironmentVariable("OPENAI_API_KEY");
+        return options.OpenAiApiKey ?? EnvironmentApiKey.Value;
     }
 
     private void EmitPayload(JsonObject payload, string? completion = null, string? note = null)
@@ -125,8 +146,7 @@ internal sealed class ReportInterpreterRunner
             ["response"] = completion,
         };
 
-        var serializerOptions = new JsonSerializerOptions { WriteIndented = true };
-        WriteLine(root.ToJsonString(serializerOptions));
+        WriteJson(root);
 
         if (!string.IsNullOrWhiteSpace(completion))
         {
@@ -136,22 +156,102 @@ internal sealed class ReportInterpreterRunner
         }
     }
 
+    private async Task<string> CallOpenAiCachedAsync(string apiKey, JsonObject payload, string userPrompt, CancellationToken cancellationToken)
+    {
+        var cacheDirectory = Environment.GetEnvironmentVariable("MENTOR_LLM_CACHE");
+        if (string.IsNullOrWhiteSpace(cacheDirectory))
+        {
+            return await CallOpenAiWithRetryAsync(apiKey, payload, userPrompt, cancellationToken);
+        }
+
+        var cachePath = Path.Combine(cacheDirectory, ComputeCacheKey(payload, userPrompt) + ".txt");
+        var cached = await TryReadCachedCompletionAsync(cachePath, cancellationToken);
+        if (cached is not null)
+        {
+            return cached;
+        }
+
+        var completion = await CallOpenAiWithRetryAsync(apiKey, payload, userPrompt, cancellationToken);
+        TryWriteCachedCompletion(cachePath, completion);
+        return completion;
+    }
+
+    private string ComputeCacheKey(JsonObject payload, string userPrompt)
+    {
+        var buffer = new ArrayBufferWriter<byte>();
+        using (var writer = new Utf8JsonWriter(buffer))
+        {
+            writer.WriteStartArray();
+            writer.WriteStringValue(options.OpenAiModel);
+            writer.WriteStringValue(SystemPrompt);
+            writer.WriteStringValue(userPrompt);
+            payload.WriteTo(writer);
+            writer.WriteEndArray();
+        }
+
+        return Convert.ToHexString(SHA256.HashData(buffer.WrittenSpan)).ToLowerInvariant();
+    }
+
+    private static async Task<string?> TryReadCachedCompletionAsync(string path, CancellationToken cancellationToken)
+    {
+        try
+        {
+            return File.Exists(path) ? await File.ReadAllTextAsync(path, cancellationToken) : null;
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+        {
+            return null;
+        }
+    }
+
+    private void TryWriteCachedCompletion(string path, string completion)
+    {
+        try
+        {
+            Directory.CreateDirectory(Path.GetDirectoryName(path)!);
+            // Write to a temp file first so an interrupted run never leaves a partial cache entry.
+            var tempPath = path + ".tmp";
+            File.WriteAllText(tempPath, completion);
+            File.Move(tempPath, path, overwrite: true);
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+        {
+            WriteError($"Failed to cache OpenAI response: {ex.Message}");
+        }
+    }
+
     private async Task<string> CallOpenAiWithRetryAsync(string apiKey, JsonObject payload, string userPrompt, CancellationToken cancellationToken)
     {
-        var delayMs = 1000;
+        var requestBody = BuildRequestBody(payload, userPrompt);
+        var delay = InitialRetryDelay;
         Exception? lastError = null;
 
         for (var attempt = 1; attempt <= MaxRetries; attempt++)
         {
             try
             {
-                return await CallOpenAiAsync(apiKey, payload, userPrompt, cancellationToken);
+                await OpenAiConcurrency.WaitAsync(cancellationToken);
+                try
+                {
+                    return await CallOpenAiAsync(apiKey, requestBody, cancellationToken);
+                }
+                finally
+                {
+                    OpenAiConcurrency.Release();
+                }
             }
             catch (OpenAiResponseException ex) when (ex.StatusCode == HttpStatusCode.TooManyRequests && attempt < MaxRetries)
             {
                 lastError = ex;
-                await Task.Delay(delayMs, cancellationToken);
-                delayMs *= 2;
+                // Prefer the server's advertised reset over blind doubling; jitter keeps parallel callers from retrying in lockstep.
+                var wait = ex.RetryAfter ?? delay;
+                if (wait > MaxRetryDelay)
+                {
+                    wait = MaxRetryDelay;
+                }
+
+                await Task.Delay(wait + TimeSpan.FromMilliseconds(Random.Shared.Next(MaxRetryJitterMilliseconds)), cancellationToken);
+                delay = delay * 2 < MaxRetryDelay ? delay * 2 : MaxRetryDelay;
             }
             catch (Exception ex)
             {
@@ -163,34 +263,113 @@ internal sealed class ReportInterpreterRunner
         throw lastError ?? new InvalidOperationException("OpenAI call failed without an exception.");
     }
 
-    private async Task<string> CallOpenAiAsync(string apiKey, JsonObject payload, string userPrompt, CancellationToken cancellationToken)
+    private byte[] BuildRequestBody(JsonObject payload, string userPrompt)
     {
-        using var client = new HttpClient();
-        client.DefaultRequestHeaders.Authorization = new AuthenticationHeaderValue("Bearer", apiKey);
-        client.DefaultRequestHeaders.Accept.Add(new MediaTypeWithQualityHeaderValue("application/json"));
-        client.DefaultRequestHeaders.UserAgent.ParseAdd("MentorTrainingRunner/1.0");
-
-        var systemPrompt = "You are the Report Interpreter Agent for Mentor CLI runs. Given the JSON payload, explain the current results concisely: identify run-id, missing artifacts, summarize training_status checkpoints/metadata, timers highlights, and configuration notes. Keep it short and actionable.";
+        var payloadJson = payload.ToJsonString();
+        if (HasOversizedArray(payload))
+        {
+            // Long checkpoint/timer arrays cost prompt tokens without helping the summary; only the LLM copy is compacted.
+            var compactedJson = CompactForPrompt(payload)!.ToJsonString();
+            WriteError($"Compacted report for the LLM prompt from {payloadJson.Length} to {compactedJson.Length} characters.");
+            payloadJson = compactedJson;
+        }
 
         var requestBody = new
         {
             model = options.OpenAiModel,
             messages = new object[]
             {
-                new { role = "system", content = systemPrompt },
+                new { role = "system", content = SystemPrompt },
                 new { role = "user", content = userPrompt },
-                new { role = "user", content = payload.ToJsonString(new JsonSerializerOptions { WriteIndented = false }) }
+                new { role = "user", content = payloadJson }
             }
         };
 
-        var content = new StringContent(JsonSerializer.Serialize(requestBody), Encoding.UTF8, "application/json");
-        using var response = await client.PostAsync("https://api.openai.com/v1/chat/completions", content, cancellationToken);
+        return JsonSerializer.SerializeToUtf8Bytes(requestBody);
+    }
+
+    private static bool HasOversizedArray(JsonNode? node)
+    {
+        return node switch
+        {
+            JsonArray array => array.Count > MaxPromptArrayItems || array.Any(HasOversizedArray),
+            JsonObject obj => obj.Any(property => HasOversizedArray(property.Value)),
+            _ => false,
+        };
+    }
+
+    private static JsonNode? CompactForPrompt(JsonNode? node)
+    {
+        switch (node)
+        {
+            case JsonObject obj:
+                var compactedObject = new JsonObject();
+                foreach (var (name, value) in obj)
+                {
+                    compactedObject[name] = CompactForPrompt(value);
+                }
+
+                return compactedObject;
+            case JsonArray array when array.Count > MaxPromptArrayItems:
+                var head = new JsonArray();
+                for (var i = 0; i < PromptArrayHeadItems; i++)
+                {
+                    head.Add(CompactForPrompt(array[i]));
+                }
+
+                var tail = new JsonArray();
+                for (var i = array.Count - PromptArrayTailItems; i < array.Count; i++)
+                {
+                    tail.Add(CompactForPrompt(array[i]));
+                }
+
+                return new JsonObject
+                {
+                    ["__truncated__"] = true,
+                    ["count"] = array.Count,
+                    ["head"] = head,
+                    ["tail"] = tail,
+                };
+            case JsonArray array:
+                var compactedArray = new JsonArray();
+                foreach (var item in array)
+                {
+                    compactedArray.Add(CompactForPrompt(item));
+                }
+
+                return compactedArray;
+            default:
+                return node?.DeepClone();
+        }
+    }
+
+    private static async Task<string> CallOpenAiAsync(string apiKey, byte[] requestBody, CancellationToken cancellationToken)
+    {
+        // HttpClient.Timeout only covers the wait for headers with ResponseHeadersRead, so bound the body read as well.
+        using var attemptTimeout = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        attemptTimeout.CancelAfter(SharedHttpClient.Timeout);
+        try
+        {
+            return await SendOpenAiRequestAsync(apiKey, requestBody, attemptTimeout.Token);
+        }
+        catch (OperationCanceledException ex) when (attemptTimeout.IsCancellationRequested && !cancellationToken.IsCancellationRequested)
+        {
+            throw new TimeoutException($"OpenAI call did not complete within {SharedHttpClient.Timeout.TotalSeconds:0} seconds.", ex);
+        }
+    }
+
+    private static async Task<string> SendOpenAiRequestAsync(string apiKey, byte[] requestBody, CancellationToken cancellationToken)
+    {
+        var content = new ByteArrayContent(requestBody);
+        content.Headers.ContentType = new MediaTypeHeaderValue("application/json");
+        using var request = new HttpRequestMessage(HttpMethod.Post, ChatCompletionsUri) { Content = content };
+        request.Headers.Authorization = new AuthenticationHeaderValue("Bearer", apiKey);
+        using var response = await SharedHttpClient.SendAsync(request, HttpCompletionOption.ResponseHeadersRead, cancellationToken);
 
         if (!response.IsSuccessStatusCode)
         {
-            var responseBody = await response.Content.ReadAsStringAsync(cancellationToken);
-            var truncated = responseBody.Length > 4000 ? responseBody[..4000] + "..." : responseBody;
-            throw new OpenAiResponseException(response.StatusCode, truncated);
+            var responseBody = await ReadErrorBodyAsync(response, cancellationToken);
+            throw new OpenAiResponseException(response.StatusCode, responseBody, ResolveRetryAfter(response));
         }
 
         using var responseStream = await response.Content.ReadAsStreamAsync(cancellationToken);
@@ -204,6 +383,137 @@ internal sealed class ReportInterpreterRunner
         return message;
     }
 
+    private static HttpClient CreateHttpClient()
+    {
+        var handler = new SocketsHttpHandler
+        {
+            PooledConnectionLifetime = TimeSpan.FromMinutes(5),
+            PooledConnectionIdleTimeout = TimeSpan.FromSeconds(30),
+            MaxConnectionsPerServer = 32,
+            EnableMultipleHttp2Connections = true,
+        };
+
+        var client = new HttpClient(handler)
+        {
+            DefaultRequestVersion = HttpVersion.Version20,
+            DefaultVersionPolicy = HttpVersionPolicy.RequestVersionOrLower,
+        };
+        client.DefaultRequestHeaders.Accept.Add(new MediaTypeWithQualityHeaderValue("application/json"));
+        client.DefaultRequestHeaders.UserAgent.ParseAdd("MentorTrainingRunner/1.0");
+        return client;
+    }
+
+    private static async Task<string> ReadErrorBodyAsync(HttpResponseMessage response, CancellationToken cancellationToken)
+    {
+        // One byte past the limit shows whether the body was truncated.
+        using var stream = await response.Content.ReadAsStreamAsync(cancellationToken);
+        var buffer = new byte[MaxErrorBodyBytes + 1];
+        var bytesRead = await stream.ReadAtLeastAsync(buffer, buffer.Length, throwOnEndOfStream: false, cancellationToken);
+        var text = Encoding.UTF8.GetString(buffer, 0, Math.Min(bytesRead, MaxErrorBodyBytes));
+        return bytesRead > MaxErrorBodyBytes ? text + "..." : text;
+    }
+
+    private static TimeSpan? ResolveRetryAfter(HttpResponseMessage response)
+    {
+        if (response.Headers.RetryAfter is { } retryAfter)
+        {
+            if (retryAfter.Delta is { } delta)
+            {
+                return delta;
+            }
+
+            if (retryAfter.Date is { } date)
+            {
+                var untilDate = date - DateTimeOffset.UtcNow;
+                return untilDate > TimeSpan.Zero ? untilDate : TimeSpan.Zero;
+            }
+        }
+
+        return response.Headers.TryGetValues("x-ratelimit-reset-requests", out var values)
+            ? TryParseResetDuration(values.FirstOrDefault())
+            : null;
+    }
+
+    // OpenAI reports rate-limit resets as Go-style durations such as "1s", "250ms" or "6m0s".
+    private static TimeSpan? TryParseResetDuration(string? value)
+    {
+        if (string.IsNullOrWhiteSpace(value))
+        {
+            return null;
+        }
+
+        var remaining = value.AsSpan().Trim();
+        var total = TimeSpan.Zero;
+        while (!remaining.IsEmpty)
+        {
+            var numberLength = 0;
+            while (numberLength < remaining.Length && (char.IsDigit(remaining[numberLength]) || remaining[numberLength] == '.'))
+            {
+                numberLength++;
+            }
+
+            var unitLength = 0;
+            while (numberLength + unitLength < remaining.Length && char.IsLetter(remaining[numberLength + unitLength]))
+            {
+                unitLength++;
+            }
+
+            if (numberLength == 0
+                || unitLength == 0
+                || !double.TryParse(remaining[..numberLength], NumberStyles.Float, CultureInfo.InvariantCulture, out var amount))
+            {
+                return null;
+            }
+
+            switch (remaining.Slice(numberLength, unitLength))
+            {
+                case "h":
+                    total += TimeSpan.FromHours(amount);
+                    break;
+                case "m":
+                    total += TimeSpan.FromMinutes(amount);
+                    break;
+                case "s":
+                    total += TimeSpan.FromSeconds(amount);
+                    break;
+                case "ms":
+                    total += TimeSpan.FromMilliseconds(amount);
+                    break;
+                default:
+                    return null;
+            }
+
+            remaining = remaining[(numberLength + unitLength)..];
+        }
+
+        return total;
+    }
+
+    private static SemaphoreSlim CreateConcurrencyGate()
+    {
+        var configured = Environment.GetEnvironmentVariable("MENTOR_LLM_CONCURRENCY");
+        var limit = int.TryParse(configured, out var parsed) && parsed > 0 ? parsed : 8;
+        return new SemaphoreSlim(limit, limit);
+    }
+
+    private void WriteJson(JsonNode node)
+    {
+        if (standardOutput is null)
+        {
+            WriteLine(node.ToJsonString(IndentedSerializerOptions));
+            return;
+        }
+
+        outputWriter.Flush();
+        using (var writer = new Utf8JsonWriter(standardOutput, IndentedWriterOptions))
+        {
+            node.WriteTo(writer);
+        }
+
+        standardOutput.Flush();
+        WriteLine();
+    }
+
     private void WriteLine(string? message = null)
     {
         if (message is null)
@@ -229,11 +539,13 @@ internal sealed class OpenAiResponseException : Exception
 {
     public HttpStatusCode StatusCode { get; }
     public string ResponseBody { get; }
+    public TimeSpan? RetryAfter { get; }
 
-    public OpenAiResponseException(HttpStatusCode statusCode, string responseBody)
+    public OpenAiResponseException(HttpStatusCode statusCode, string responseBody, TimeSpan? retryAfter = null)
         : base($"OpenAI call failed with status {(int)statusCode} {statusCode}")
     {
         StatusCode = statusCode;
         ResponseBody = responseBody;
+        RetryAfter = retryAfter;
     }
 }
@@ -23,8 +23,7 @@ internal sealed record ReportOptions(
                 return false;
             }
 
-            var key = rawArg[2..];
-            switch (key)
+            switch (rawArg.AsSpan(2))
             {
                 case "run-id":
                     {
@@ -60,7 +59,7 @@ internal sealed record ReportOptions(
                     }
 
                 default:
-                    error = $"Unknown option '--{key}'.";
+                    error = $"Unknown option '{rawArg}'.";
                     return false;
             }
         }
@@ -1,7 +1,7 @@
 using System.Globalization;
 using System.IO;
-using System.Text;
-using YamlDotNet.RepresentationModel;
+using YamlDotNet.Core;
+using YamlDotNet.Core.Events;
 
 namespace MentorTrainingRunner;
 
@@ -36,14 +36,15 @@ internal sealed record TrainingOptions(
         }
     }
 
-    public static bool TryParse(string[] args, out TrainingOptions? options, out string? error)
+    public static bool TryParse(IReadOnlyList<string> args, out TrainingOptions? options, out string? error)
     {
         options = null;
         error = null;
 
         var builder = new OptionsBuilder();
+        var baseDirectory = Directory.GetCurrentDirectory();
 
-        for (var i = 0; i < args.Length; i++)
+        for (var i = 0; i < args.Count; i++)
         {
             var rawArg = args[i];
             if (!rawArg.StartsWith("--", StringComparison.Ordinal))
@@ -52,8 +53,7 @@ internal sealed record TrainingOptions(
                 return false;
             }
 
-            var key = rawArg[2..];
-            switch (key)
+            switch (rawArg.AsSpan(2))
             {
                 case "env-path":
                     {
@@ -62,7 +62,7 @@ internal sealed record TrainingOptions(
                             return false;
                         }
 
-                        builder.EnvExecutablePath = NormalizeFile(value, "environment executable", ref error);
+                        builder.EnvExecutablePath = NormalizeFile(value, "environment executable", baseDirectory, ref error);
                         if (builder.EnvExecutablePath is null)
                         {
                             return false;
@@ -78,7 +78,7 @@ internal sealed record TrainingOptions(
                             return false;
                         }
 
-                        builder.TrainerConfigPath = NormalizeFile(value, "trainer config", ref error);
+                        builder.TrainerConfigPath = NormalizeFile(value, "trainer config", baseDirectory, ref error);
                         if (builder.TrainerConfigPath is null)
                         {
                             return false;
@@ -111,7 +111,7 @@ internal sealed record TrainingOptions(
                             return false;
                         }
 
-                        builder.ResultsDirectory = NormalizeDirectory(value, ref error);
+                        builder.ResultsDirectory = NormalizeDirectory(value, baseDirectory, ref error);
                         if (builder.ResultsDirectory is null)
                         {
                             return false;
@@ -171,7 +171,7 @@ internal sealed record TrainingOptions(
                     break;
 
                 default:
-                    error = $"Unknown option '--{key}'.";
+                    error = $"Unknown option '{rawArg}'.";
                     return false;
             }
         }
@@ -182,7 +182,7 @@ internal sealed record TrainingOptions(
             return false;
         }
 
-        builder.ResultsDirectory ??= NormalizeDirectory(DefaultResultsDirectory, ref error);
+        builder.ResultsDirectory ??= NormalizeDirectory(DefaultResultsDirectory, baseDirectory, ref error);
         if (builder.ResultsDirectory is null)
         {
             return false;
@@ -206,9 +206,9 @@ internal sealed record TrainingOptions(
         return true;
     }
 
-    private static bool TryReadValue(string[] args, ref int index, string flag, out string value, out string? error)
+    private static bool TryReadValue(IReadOnlyList<string> args, ref int index, string flag, out string value, out string? error)
     {
-        if (index + 1 >= args.Length)
+        if (index + 1 >= args.Count)
         {
             error = $"Missing value for --{flag}.";
             value = string.Empty;
@@ -220,11 +220,11 @@ internal sealed record TrainingOptions(
         return true;
     }
 
-    private static string? NormalizeFile(string path, string description, ref string? error)
+    private static string? NormalizeFile(string path, string description, string baseDirectory, ref string? error)
     {
         try
         {
-            var fullPath = Path.GetFullPath(path);
+            var fullPath = Path.GetFullPath(path, baseDirectory);
             if (!File.Exists(fullPath))
             {
                 error = $"Could not find the specified {description} at '{fullPath}'.";
@@ -240,11 +240,11 @@ internal sealed record TrainingOptions(
         }
     }
 
-    private static string? NormalizeDirectory(string path, ref string? error)
+    private static string? NormalizeDirectory(string path, string baseDirectory, ref string? error)
     {
         try
         {
-            return Path.GetFullPath(path);
+            return Path.GetFullPath(path, baseDirectory);
         }
         catch (Exception ex)
         {
@@ -255,9 +255,8 @@ internal sealed record TrainingOptions(
 
     private static string BuildDefaultRunId(string? resultsDirectory, string trainerConfigPath)
     {
-        var prefix = $"{BuildConfigPrefix(trainerConfigPath)}-";
-        var datePart = DateTime.UtcNow.ToString("yyMMdd", CultureInfo.InvariantCulture);
-        prefix += $"{datePart}-";
+        var today = DateTime.UtcNow;
+        var prefix = string.Create(CultureInfo.InvariantCulture, $"{BuildConfigPrefix(trainerConfigPath)}-{today.Year % 100:D2}{today.Month:D2}{today.Day:D2}-");
         var nextSequence = 1;
 
         if (!string.IsNullOrWhiteSpace(resultsDirectory) && Directory.Exists(resultsDirectory))
@@ -323,9 +322,10 @@ internal sealed record TrainingOptions(
 
     private static string BuildBehaviorAcronym(string source)
     {
-        var acronym = new StringBuilder();
+        Span<char> acronym = stackalloc char[3];
+        var length = 0;
         char previous = default;
-        for (var i = 0; i < source.Length && acronym.Length < 3; i++)
+        for (var i = 0; i < source.Length && length < acronym.Length; i++)
         {
             var current = source[i];
             if (!char.IsLetterOrDigit(current))
@@ -341,35 +341,27 @@ internal sealed record TrainingOptions(
 
             if (isBoundary)
             {
-                acronym.Append(char.ToLowerInvariant(current));
+                acronym[length++] = char.ToLowerInvariant(current);
             }
 
             previous = current;
         }
 
-        if (acronym.Length < 3)
+        for (var i = 0; i < source.Length && length < acronym.Length; i++)
         {
-            foreach (var c in source.Where(char.IsLetterOrDigit))
+            if (char.IsLetterOrDigit(source[i]))
             {
-                if (acronym.Length >= 3)
-                {
-                    break;
-                }
-                acronym.Append(char.ToLowerInvariant(c));
+                acronym[length++] = char.ToLowerInvariant(source[i]);
             }
         }
 
-        if (acronym.Length == 0)
+        if (length == 0)
         {
             return "run";
         }
 
-        if (acronym.Length < 3)
-        {
-            acronym.Append(new string('x', 3 - acronym.Length));
-        }
-
-        return acronym.ToString(0, 3);
+        acronym[length..].Fill('x');
+        return new string(acronym);
     }
 
     private static string? TryReadBehaviorName(string trainerConfigPath)
@@ -377,25 +369,34 @@ internal sealed record TrainingOptions(
         try
         {
             using var reader = new StreamReader(trainerConfigPath);
-            var yaml = new YamlStream();
-            yaml.Load(reader);
-            if (yaml.Documents.Count == 0 || yaml.Documents[0].RootNode is not YamlMappingNode root)
+            var parser = new Parser(reader);
+            parser.Consume<StreamStart>();
+            if (!parser.TryConsume<DocumentStart>(out _) || !parser.TryConsume<MappingStart>(out _))
             {
                 return null;
             }
 
-            if (!root.Children.TryGetValue(new YamlScalarNode("behaviors"), out var behaviorsNode))
+            while (!parser.Accept<MappingEnd>(out _))
             {
-                return null;
-            }
+                if (!parser.TryConsume<Scalar>(out var key))
+                {
+                    parser.SkipThisAndNestedEvents();
+                    parser.SkipThisAndNestedEvents();
+                    continue;
+                }
 
-            if (behaviorsNode is not YamlMappingNode behaviors || behaviors.Children.Count == 0)
-            {
-                return null;
+                if (!string.Equals(key.Value, "behaviors", StringComparison.Ordinal))
+                {
+                    parser.SkipThisAndNestedEvents();
+                    continue;
+                }
+
+                return parser.TryConsume<MappingStart>(out _) && parser.TryConsume<Scalar>(out var firstKey)
+                    ? firstKey.Value
+                    : null;
             }
 
-            var firstKey = behaviors.Children.Keys.OfType<YamlScalarNode>().FirstOrDefault();
-            return firstKey?.Value;
+            return null;
         }
         catch
         {
@@ -6,6 +6,10 @@ namespace MentorTrainingRunner;
 
 internal sealed class TrainingReportGenerator
 {
+    private static readonly JsonWriterOptions IndentedWriterOptions = new() { Indented = true };
+    private static readonly StringComparer EntryNameComparer = OperatingSystem.IsWindows() || OperatingSystem.IsMacOS()
+        ? StringComparer.OrdinalIgnoreCase
+        : StringComparer.Ordinal;
     private readonly ReportOptions options;
 
     public TrainingReportGenerator(ReportOptions options)
@@ -16,31 +20,37 @@ internal sealed class TrainingReportGenerator
     public async Task<int> RunAsync(CancellationToken cancellationToken = default)
     {
         var report = await GenerateReportAsync(cancellationToken);
-        var serializerOptions = new JsonSerializerOptions
+        var standardOutput = Console.OpenStandardOutput();
+        await using (var writer = new Utf8JsonWriter(standardOutput, IndentedWriterOptions))
         {
-            WriteIndented = true,
-        };
+            report.WriteTo(writer);
+            await writer.FlushAsync(cancellationToken);
+        }
 
-        Console.WriteLine(report.ToJsonString(serializerOptions));
+        Console.WriteLine();
         return 0;
     }
 
     public async Task<JsonObject> GenerateReportAsync(CancellationToken cancellationToken = default)
     {
         var runDirectory = Path.Combine(options.ResultsDirectory, options.RunId);
-        if (!Directory.Exists(runDirectory))
+        var runEntries = TryListEntries(runDirectory);
+        if (runEntries is null)
         {
             throw new InvalidOperationException($"Run directory not found at '{runDirectory}'.");
         }
 
         var runLogsDirectory = Path.Combine(runDirectory, "run_logs");
-        if (!Directory.Exists(runLogsDirectory))
+        var runLogsEntries = runEntries.TryGetValue("run_logs", out var runLogsEntry) && runLogsEntry is DirectoryInfo
+            ? TryListEntries(runLogsDirectory)
+            : null;
+        if (runLogsEntries is null)
         {
             throw new InvalidOperationException($"Run logs directory not found at '{runLogsDirectory}'.");
         }
 
         var trainingStatusPath = Path.Combine(runLogsDirectory, "training_status.json");
-        if (!File.Exists(trainingStatusPath))
+        if (!ContainsFile(runLogsEntries, "training_status.json"))
         {
             throw new InvalidOperationException(
                 $"training_status.json not found at '{trainingStatusPath}'. Ensure the run completed successfully."
@@ -62,7 +72,7 @@ internal sealed class TrainingReportGenerator
         };
 
         var timersPath = Path.Combine(runLogsDirectory, "timers.json");
-        if (File.Exists(timersPath))
+        if (ContainsFile(runLogsEntries, "timers.json"))
         {
             var timersContent = await LoadJsonAsync(timersPath, cancellationToken);
             artifacts["timers"] = BuildArtifact(timersPath, timersContent);
@@ -73,7 +83,7 @@ internal sealed class TrainingReportGenerator
         }
 
         var configurationPath = Path.Combine(runDirectory, "configuration.yaml");
-        if (File.Exists(configurationPath))
+        if (ContainsFile(runEntries, "configuration.yaml"))
         {
             var configurationText = await File.ReadAllTextAsync(configurationPath, cancellationToken);
             artifacts["configuration"] = BuildArtifact(configurationPath, JsonValue.Create(configurationText));
@@ -87,6 +97,30 @@ internal sealed class TrainingReportGenerator
         return reportRoot;
     }
 
+    private static Dictionary<string, FileSystemInfo>? TryListEntries(string directory)
+    {
+        try
+        {
+            // TryAdd skips names that differ only by case on a case-sensitive volume the comparer treats as insensitive.
+            var entries = new Dictionary<string, FileSystemInfo>(EntryNameComparer);
+            foreach (var entry in new DirectoryInfo(directory).EnumerateFileSystemInfos())
+            {
+                entries.TryAdd(entry.Name, entry);
+            }
+
+            return entries;
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException or ArgumentException)
+        {
+            return null;
+        }
+    }
+
+    private static bool ContainsFile(Dictionary<string, FileSystemInfo> entries, string name)
+    {
+        return entries.TryGetValue(name, out var entry) && entry is FileInfo;
+    }
+
     private static JsonObject BuildArtifact(string path, JsonNode? content)
     {
         return new JsonObject
@@ -109,7 +143,7 @@ internal sealed class TrainingReportGenerator
 
     private static async Task<JsonNode> LoadJsonAsync(string path, CancellationToken cancellationToken)
     {
-        await using var stream = File.OpenRead(path);
+        await using var stream = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.Read, bufferSize: 0, FileOptions.Asynchronous | FileOptions.SequentialScan);
         var node = await JsonNode.ParseAsync(stream, cancellationToken: cancellationToken);
         if (node is null)
         {
@@ -16,6 +16,9 @@ internal sealed class TrainingSessionRunner
     private const int BasePortBlockSize = 20;
     private const int BasePortStride = BasePortBlockSize;
     private const int MaxBasePortProbes = 200;
+    internal const int OutputBufferSize = 64 * 1024;
+    private static readonly TimeSpan OutputFlushInterval = TimeSpan.FromMilliseconds(250);
+    private static readonly Lazy<string> CondaExecutable = new(ResolveCondaExecutable);
     private readonly TrainingOptions _options;
     private readonly TextWriter _outputWriter;
     private readonly TextWriter _errorWriter;
@@ -26,6 +29,7 @@ internal sealed class TrainingSessionRunner
     private readonly int _basePort;
     private readonly string? _basePortMessage;
     private readonly Action<int>? _onProcessStarted;
+    private readonly List<string> _isolatedTempDirectories = new();
     private Process? _mlAgentsProcess;
     private bool _cancelRequested;
     private bool _reuseExistingTensorboard;
@@ -193,6 +197,8 @@ internal sealed class TrainingSessionRunner
             {
                 Console.CancelKeyPress -= cancelHandler;
             }
+
+            DeleteIsolatedTempDirectories();
         }
     }
 
@@ -210,15 +216,19 @@ internal sealed class TrainingSessionRunner
     }
 
     private static bool IsPortInUse(int port)
+    {
+        return GetActiveTcpPorts().Contains(port);
+    }
+
+    private static HashSet<int> GetActiveTcpPorts()
     {
         try
         {
-            var listeners = IPGlobalProperties.GetIPGlobalProperties().GetActiveTcpListeners();
-            return listeners.Any(ep => ep.Port == port);
+            return IPGlobalProperties.GetIPGlobalProperties().GetActiveTcpListeners().Select(ep => ep.Port).ToHashSet();
         }
         catch
         {
-            return false;
+            return new HashSet<int>();
         }
     }
 
@@ -227,10 +237,11 @@ internal sealed class TrainingSessionRunner
         message = null;
         var requested = _options.BasePort ?? DefaultBasePort;
         var candidate = requested;
+        var activePorts = GetActiveTcpPorts();
 
         for (var attempt = 0; attempt < MaxBasePortProbes; attempt++)
         {
-            if (IsPortRangeFree(candidate))
+            if (IsPortRangeFree(candidate, activePorts))
             {
                 if (_options.BasePort.HasValue && candidate != _options.BasePort.Value)
                 {
@@ -253,11 +264,11 @@ internal sealed class TrainingSessionRunner
         return requested;
     }
 
-    private bool IsPortRangeFree(int basePort)
+    private static bool IsPortRangeFree(int basePort, HashSet<int> activePorts)
     {
         for (var offset = 0; offset < BasePortBlockSize; offset++)
         {
-            if (IsPortInUse(basePort + offset))
+            if (activePorts.Contains(basePort + offset))
             {
                 return false;
             }
@@ -285,7 +296,7 @@ internal sealed class TrainingSessionRunner
         }
         else
         {
-            startInfo.FileName = ResolveCondaExecutable();
+            startInfo.FileName = CondaExecutable.Value;
             startInfo.ArgumentList.Add("run");
             startInfo.ArgumentList.Add("--live-stream");
             startInfo.ArgumentList.Add("-n");
@@ -342,7 +353,7 @@ internal sealed class TrainingSessionRunner
         }
         else
         {
-            startInfo.FileName = ResolveCondaExecutable();
+            startInfo.FileName = CondaExecutable.Value;
             startInfo.ArgumentList.Add("run");
             startInfo.ArgumentList.Add("--live-stream");
             startInfo.ArgumentList.Add("-n");
@@ -365,19 +376,38 @@ internal sealed class TrainingSessionRunner
         return new Process { StartInfo = startInfo };
     }
 
-    private static void SetIsolatedTempDirectory(ProcessStartInfo startInfo)
+    private void SetIsolatedTempDirectory(ProcessStartInfo startInfo)
     {
         var tempRoot = Path.Combine(Path.GetTempPath(), "mentor-cli");
         Directory.CreateDirectory(tempRoot);
 
         var isolatedTemp = Path.Combine(tempRoot, Guid.NewGuid().ToString("N"));
         Directory.CreateDirectory(isolatedTemp);
+        _isolatedTempDirectories.Add(isolatedTemp);
 
         startInfo.Environment["TMP"] = isolatedTemp;
         startInfo.Environment["TEMP"] = isolatedTemp;
         startInfo.Environment["TMPDIR"] = isolatedTemp;
     }
 
+    private void DeleteIsolatedTempDirectories()
+    {
+        // Only this runner's directories are removed; leftovers from other runs may still belong to live trainers.
+        foreach (var directory in _isolatedTempDirectories)
+        {
+            try
+            {
+                Directory.Delete(directory, recursive: true);
+            }
+            catch
+            {
+                // Best-effort cleanup; a locked file only leaves the directory behind.
+            }
+        }
+
+        _isolatedTempDirectories.Clear();
+    }
+
     private static string ResolveCondaExecutable()
     {
         var fromEnv = Environment.GetEnvironmentVariable("CONDA_EXE");
@@ -484,29 +514,49 @@ internal sealed class TrainingSessionRunner
             : value;
     }
 
-    private static Task PumpStreamAsync(Stream source, Stream destination)
+    private static async Task PumpStreamAsync(Stream source, Stream destination)
     {
-        return Task.Run(async () =>
+        var buffer = ArrayPool<byte>.Shared.Rent(OutputBufferSize);
+        var sinceFlush = Stopwatch.StartNew();
+        var unflushed = false;
+        try
         {
-            var buffer = ArrayPool<byte>.Shared.Rent(8192);
-            try
+            while (true)
             {
-                while (true)
+                var readTask = source.ReadAsync(buffer.AsMemory(0, buffer.Length)).AsTask();
+                // Flush at most every OutputFlushInterval, and also once the output goes idle so the tail of a burst reaches the log.
+                if (unflushed && !readTask.IsCompleted)
                 {
-                    var bytesRead = await source.ReadAsync(buffer.AsMemory(0, buffer.Length)).ConfigureAwait(false);
-                    if (bytesRead == 0)
+                    var remaining = OutputFlushInterval - sinceFlush.Elapsed;
+                    if (remaining <= TimeSpan.Zero || await Task.WhenAny(readTask, Task.Delay(remaining)).ConfigureAwait(false) != readTask)
                     {
-                        break;
+                        await destination.FlushAsync().ConfigureAwait(false);
+                        unflushed = false;
+                        sinceFlush.Restart();
                     }
+                }
+
+                var bytesRead = await readTask.ConfigureAwait(false);
+                if (bytesRead == 0)
+                {
+                    break;
+                }
 
-                    await destination.WriteAsync(buffer.AsMemory(0, bytesRead)).ConfigureAwait(false);
+                await destination.WriteAsync(buffer.AsMemory(0, bytesRead)).ConfigureAwait(false);
+                unflushed = true;
+                if (sinceFlush.Elapsed >= OutputFlushInterval)
+                {
                     await destination.FlushAsync().ConfigureAwait(false);
+                    unflushed = false;
+                    sinceFlush.Restart();
                 }
             }
-            finally
-            {
-                ArrayPool<byte>.Shared.Return(buffer);
-            }
-        });
+
+            await destination.FlushAsync().ConfigureAwait(false);
+        }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(buffer);
+        }
     }
 }
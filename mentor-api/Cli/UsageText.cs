@@ -1,55 +1,104 @@
-using System.Text;
-
 namespace MentorTrainingRunner;
 
 internal static class UsageText
 {
-    public static string GetTrainingUsage()
-    {
-        var builder = new StringBuilder();
-        builder.AppendLine("Usage:");
-        builder.AppendLine("  dotnet run -- --config <trainer-config.yaml> [--env-path <path-to-env-exe>] [options]\\n");
-        builder.AppendLine("Options:");
-        builder.AppendLine("  --env-path <path>       Optional Unity environment executable (.exe); omit when using the Unity Editor Play mode");
-        builder.AppendLine("  --run-id <id>             Optional run identifier. Default: <config-abbr>-<YYMMDD>-<n> (abbr from YAML name, UTC date, daily counter)");
-        builder.AppendLine("  --results-dir <path>      Directory to store training artifacts. Default: X:\\\\workspace\\\\MENTOR\\\\ml-agents-training-results");
-        builder.AppendLine("  --conda-env <name>        Name of the ML-Agents Conda environment. Default: mlagents");
-        builder.AppendLine("  --base-port <port>        Base port to use when launching the environment (auto-selects from 5005 if omitted)");
-        builder.AppendLine("  --no-graphics             Launches the environment without rendering");
-        builder.AppendLine("  --skip-conda              Assume the ML-Agents tooling is already on PATH");
-        builder.AppendLine("  --tensorboard             Also start TensorBoard pointed at the results directory");
-        builder.AppendLine();
-        builder.AppendLine("Report usage:");
-        builder.AppendLine("  dotnet run -- report --run-id <id> [--results-dir <path>]");
-        builder.AppendLine();
-        builder.AppendLine("Report interpreter usage:");
-        builder.AppendLine("  dotnet run -- report-interpreter --run-id <id> [--results-dir <path>] [--prompt \"Explain current results\"] [--openai-model <model>] [--openai-api-key <key>] [--check-openai]");
-        return builder.ToString();
+    private const int TrainingFlagWidth = 26;
+    private const int ReportFlagWidth = 21;
+    private const string DefaultResultsDirectoryNote = "Default: X:\\\\workspace\\\\MENTOR\\\\ml-agents-training-results";
+    private const string ReportCommand = "dotnet run -- report --run-id <id> [--results-dir <path>]";
+    private static readonly UsageOption RunIdOption = new("--run-id <id>", "Run identifier to inspect (required)");
+    private static readonly UsageOption ResultsDirectoryOption = new("--results-dir <path>", "Directory that contains run artifacts. " + DefaultResultsDirectoryNote);
+
+    private static readonly UsageOption[] TrainingOptionTable =
+    {
+        new("--env-path <path>", "Optional Unity environment executable (.exe); omit when using the Unity Editor Play mode"),
+        new("--run-id <id>", "Optional run identifier. Default: <config-abbr>-<YYMMDD>-<n> (abbr from YAML name, UTC date, daily counter)"),
+        new("--results-dir <path>", "Directory to store training artifacts. " + DefaultResultsDirectoryNote),
+        new("--conda-env <name>", "Name of the ML-Agents Conda environment. Default: mlagents"),
+        new("--base-port <port>", "Base port to use when launching the environment (auto-selects from 5005 if omitted)"),
+        new("--no-graphics", "Launches the environment without rendering"),
+        new("--skip-conda", "Assume the ML-Agents tooling is already on PATH"),
+        new("--tensorboard", "Also start TensorBoard pointed at the results directory")
+    };
+
+    private static readonly UsageOption[] ReportOptionTable =
+    {
+        RunIdOption,
+        ResultsDirectoryOption
+    };
+
+    private static readonly UsageOption[] ReportInterpreterOptionTable =
+    {
+        RunIdOption,
+        ResultsDirectoryOption,
+        new("--prompt <text>", "Prompt to send along with the report. Default: Explain current results"),
+        new("--openai-model <m>", "OpenAI chat completion model. Default: gpt-4o-mini"),
+        new("--openai-api-key <k>", "Explicit API key (otherwise uses OPENAI_API_KEY env var)"),
+        new("--check-openai", "Skip report generation and issue a simple connectivity check call")
+    };
+
+    private static readonly string TrainingUsage = BuildTrainingUsage();
+    private static readonly string ReportUsage = BuildReportUsage();
+    private static readonly string ReportInterpreterUsage = BuildReportInterpreterUsage();
+
+    public static string GetTrainingUsage() => TrainingUsage;
+
+    public static string GetReportUsage() => ReportUsage;
+
+    public static string GetReportInterpreterUsage() => ReportInterpreterUsage;
+
+    private static string BuildTrainingUsage()
+    {
+        var lines = new List<string>
+        {
+            "Usage:",
+            "  dotnet run -- --config <trainer-config.yaml> [--env-path <path-to-env-exe>] [options]\\n",
+            "Options:"
+        };
+        lines.AddRange(FormatOptions(TrainingOptionTable, TrainingFlagWidth));
+        lines.Add(string.Empty);
+        lines.Add("Report usage:");
+        lines.Add("  " + ReportCommand);
+        lines.Add(string.Empty);
+        lines.Add("Report interpreter usage:");
+        lines.Add("  dotnet run -- report-interpreter --run-id <id> [--results-dir <path>] [--prompt \"Explain current results\"] [--openai-model <model>] [--openai-api-key <key>] [--check-openai]");
+        return JoinLines(lines);
+    }
+
+    private static string BuildReportUsage()
+    {
+        var lines = new List<string>
+        {
+            "Usage:",
+            "  " + ReportCommand + "\\n",
+            "Options:"
+        };
+        lines.AddRange(FormatOptions(ReportOptionTable, ReportFlagWidth));
+        return JoinLines(lines);
     }
 
-    public static string GetReportUsage()
+    private static string BuildReportInterpreterUsage()
     {
-        var builder = new StringBuilder();
-        builder.AppendLine("Usage:");
-        builder.AppendLine("  dotnet run -- report --run-id <id> [--results-dir <path>]\\n");
-        builder.AppendLine("Options:");
-        builder.AppendLine("  --run-id <id>        Run identifier to inspect (required)");
-        builder.AppendLine("  --results-dir <path> Directory that contains run artifacts. Default: X:\\\\workspace\\\\MENTOR\\\\ml-agents-training-results");
-        return builder.ToString();
+        var lines = new List<string>
+        {
+            "Usage:",
+            "  dotnet run -- report-interpreter --run-id <id> [--results-dir <path>] [--prompt <text>] [--openai-model <model>] [--openai-api-key <key>] [--check-openai]\\n",
+            "Options:"
+        };
+        lines.AddRange(FormatOptions(ReportInterpreterOptionTable, ReportFlagWidth));
+        return JoinLines(lines);
     }
 
-    public static string GetReportInterpreterUsage()
-    {
-        var builder = new StringBuilder();
-        builder.AppendLine("Usage:");
-        builder.AppendLine("  dotnet run -- report-interpreter --run-id <id> [--results-dir <path>] [--prompt <text>] [--openai-model <model>] [--openai-api-key <key>] [--check-openai]\\n");
-        builder.AppendLine("Options:");
-        builder.AppendLine("  --run-id <id>        Run identifier to inspect (required)");
-        builder.AppendLine("  --results-dir <path> Directory that contains run artifacts. Default: X:\\\\workspace\\\\MENTOR\\\\ml-agents-training-results");
-        builder.AppendLine("  --prompt <text>      Prompt to send along with the report. Default: Explain current results");
-        builder.AppendLine("  --openai-model <m>   OpenAI chat completion model. Default: gpt-4o-mini");
-        builder.AppendLine("  --openai-api-key <k> Explicit API key (otherwise uses OPENAI_API_KEY env var)");
-        builder.AppendLine("  --check-openai       Skip report generation and issue a simple connectivity check call");
-        return builder.ToString();
+    private static IEnumerable<string> FormatOptions(IEnumerable<UsageOption> options, int flagWidth)
+    {
+        return options.Select(option => "  " + option.Flag.PadRight(flagWidth) + option.Description);
     }
+
+    // Every line, including the last, is terminated with Environment.NewLine.
+    private static string JoinLines(IEnumerable<string> lines)
+    {
+        return string.Join(Environment.NewLine, lines) + Environment.NewLine;
+    }
+
+    private sealed record UsageOption(string Flag, string Description);
 }
@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Globalization;
 using System.Linq;
@@ -5,7 +6,11 @@ using System.Net.NetworkInformation;
 using System.Text;
 using System.Text.Json;
 using System.Text.Json.Nodes;
+using System.Text.Json.Serialization;
 using YamlDotNet.RepresentationModel;
+using Microsoft.OpenApi;
+using Microsoft.OpenApi.Extensions;
+using Swashbuckle.AspNetCore.Swagger;
 using MentorTrainingRunner;
 using System.Diagnostics;
 var builder = WebApplication.CreateBuilder(args);
@@ -13,8 +18,8 @@ builder.Configuration
     .AddJsonFile("mentor-settings.json", optional: true, reloadOnChange: true)
     .AddJsonFile("mentor-settings.local.json", optional: true, reloadOnChange: true);
 TrainingOptions.SetDefaultResultsDirectory(builder.Configuration["MentorApi:ResultsDirectory"]);
-builder.WebHost.ConfigureKestrel(o => o.AllowSynchronousIO = true);
 builder.WebHost.UseUrls("http://localhost:5113");
+builder.Services.ConfigureHttpJsonOptions(options => options.SerializerOptions.TypeInfoResolverChain.Insert(0, MentorApiJsonContext.Default));
 builder.Services.AddEndpointsApiExplorer();
 builder.Services.AddSwaggerGen();
 builder.Services.AddCors(options =>
@@ -29,11 +34,26 @@ builder.Services.AddCors(options =>
 var app = builder.Build();
 if (app.Environment.IsDevelopment())
 {
-    app.UseSwagger();
+    // The generated document only changes on restart, so serialize each one once and serve the bytes.
+    var swaggerDocuments = new ConcurrentDictionary<string, byte[]>(StringComparer.Ordinal);
+    app.MapGet("/swagger/{documentName}/swagger.json", (string documentName, ISwaggerProvider swaggerProvider) =>
+    {
+        try
+        {
+            var json = swaggerDocuments.GetOrAdd(documentName, name =>
+                Encoding.UTF8.GetBytes(swaggerProvider.GetSwagger(name).SerializeAsJson(OpenApiSpecVersion.OpenApi3_0)));
+            return Results.Bytes(json, "application/json");
+        }
+        catch (UnknownSwaggerDocument)
+        {
+            return Results.NotFound();
+        }
+    }).ExcludeFromDescription();
     app.UseSwaggerUI();
 }
 app.UseCors();
 var runStore = new TrainingRunStore();
+var trainingUsage = UsageText.GetTrainingUsage();
 var dashboardHost = new DashboardHost();
 var fileBridgeRoot = builder.Configuration["MentorApi:FileBridgeRoot"];
 if (string.IsNullOrWhiteSpace(fileBridgeRoot))
@@ -44,13 +64,24 @@ else
 {
     Console.WriteLine($"[FileBridge] File bridge root set to '{fileBridgeRoot}'.");
 }
-Console.WriteLine("[Resume] Checking for runs marked to resume on start...");
-var resumeMessages = runStore.ResumeUnfinishedRuns(msg => Console.WriteLine($"[Resume] {msg}"));
-var resumedAny = resumeMessages.Any(msg => msg.Contains("Resumed", StringComparison.OrdinalIgnoreCase));
-if (!resumedAny)
+// Scan for resumable runs once the server is listening so slow results storage does not delay startup.
+app.Lifetime.ApplicationStarted.Register(() => _ = Task.Run(() =>
 {
-    Console.WriteLine("[Resume] No runs were resumed. Use the web app to mark runs for resume.");
-}
+    Console.WriteLine("[Resume] Checking for runs marked to resume on start...");
+    try
+    {
+        var resumeMessages = runStore.ResumeUnfinishedRuns(msg => Console.WriteLine($"[Resume] {msg}"));
+        var resumedAny = resumeMessages.Any(msg => msg.Contains("Resumed", StringComparison.OrdinalIgnoreCase));
+        if (!resumedAny)
+        {
+            Console.WriteLine("[Resume] No runs were resumed. Use the web app to mark runs for resume.");
+        }
+    }
+    catch (Exception ex)
+    {
+        Console.WriteLine($"[Resume] Failed to resume runs: {ex.Message}");
+    }
+}));
 var dashboardStartup = dashboardHost.Start();
 if (dashboardStartup.Started || dashboardStartup.AlreadyRunning)
 {
@@ -105,10 +136,10 @@ app.MapPost("/train", (TrainingRequest request) =>
     var resolvedEnvPath = string.IsNullOrWhiteSpace(request.EnvPath) ? null : request.EnvPath;
     var resolvedConfig = string.IsNullOrWhiteSpace(request.Config) ? "config/ppo/3DBall.yaml" : request.Config;
     var resolvedRunId = string.IsNullOrWhiteSpace(request.RunId) ? null : request.RunId;
-    var cliArgs = CliArgs.FromTraining(request, resolvedEnvPath, resolvedConfig, resolvedRunId).ToArray();
+    var cliArgs = CliArgs.FromTraining(request, resolvedEnvPath, resolvedConfig, resolvedRunId);
     if (!TrainingOptions.TryParse(cliArgs, out var options, out var error) || options is null)
     {
-        return Results.BadRequest(new { error = error ?? "Invalid training options.", usage = UsageText.GetTrainingUsage() });
+        return Results.BadRequest(new { error = error ?? "Invalid training options.", usage = trainingUsage });
     }
     var startResult = runStore.TryStart(options);
     if (!startResult.IsStarted || startResult.Run is null)
@@ -237,14 +268,14 @@ app.MapPost("/process-kill", (KillProcessRequest request) =>
     }
     return Results.Ok(result);
 });
-app.MapPost("/train/archive", (ArchiveRunRequest request) =>
+app.MapPost("/train/archive", async (ArchiveRunRequest request) =>
 {
     if (string.IsNullOrWhiteSpace(request.RunId))
     {
         return Results.BadRequest(new { error = "runId is required." });
     }
 
-    var result = runStore.ArchiveRun(request.RunId, request.ResultsDir);
+    var result = await runStore.ArchiveRunAsync(request.RunId, request.ResultsDir);
     if (!result.Success)
     {
         return Results.BadRequest(new { error = result.Message ?? "Unable to archive run.", runId = request.RunId });
@@ -252,9 +283,9 @@ app.MapPost("/train/archive", (ArchiveRunRequest request) =>
 
     return Results.Ok(new { success = true, runId = request.RunId, archivedTo = result.ArchivedTo });
 });
-app.MapPost("/train/delete", (DeleteRunRequest request) =>
+app.MapPost("/train/delete", async (DeleteRunRequest request) =>
 {
-    var result = runStore.DeleteRun(request);
+    var result = await runStore.DeleteRunAsync(request);
     if (!result.Success)
     {
         return Results.BadRequest(new { error = result.Message ?? $"Unable to delete '{request.RunId}'.", confirmRequired = result.ConfirmRequired });
@@ -262,10 +293,10 @@ app.MapPost("/train/delete", (DeleteRunRequest request) =>
 
     return Results.Ok(new { deleted = true, runId = request.RunId, deletedFrom = result.DeletedFrom, message = result.Message });
 });
-app.MapGet("/tensorboard/start", () =>
+app.MapGet("/tensorboard/start", async () =>
 {
     var request = new StartTensorboardRequest(null, null, null, null, null);
-    var result = runStore.StartTensorboard(request);
+    var result = await runStore.StartTensorboardAsync(request);
     if (!result.Started && !result.AlreadyRunning)
     {
         return Results.BadRequest(new { error = result.Message ?? "Unable to start TensorBoard." });
@@ -324,34 +355,42 @@ internal static class FileBridge
 internal sealed record FilePathResolution(bool Success, string? Error, string? FullPath, string? Root);
 internal static class CliArgs
 {
+    private const int MaxArgumentCount = 16;
+
     public static List<string> FromTraining(TrainingRequest request, string? envPathOverride = null, string? configOverride = null, string? runIdOverride = null)
     {
         var envPath = envPathOverride ?? request.EnvPath;
         var config = configOverride ?? request.Config;
-        var args = new List<string>();
+        var args = new List<string>(MaxArgumentCount);
         if (!string.IsNullOrWhiteSpace(envPath))
         {
-            args.AddRange(new[] { "--env-path", envPath! });
+            args.Add("--env-path");
+            args.Add(envPath!);
         }
         if (!string.IsNullOrWhiteSpace(config))
         {
-            args.AddRange(new[] { "--config", config! });
+            args.Add("--config");
+            args.Add(config!);
         }
         if (!string.IsNullOrWhiteSpace(runIdOverride))
         {
-            args.AddRange(new[] { "--run-id", runIdOverride! });
+            args.Add("--run-id");
+            args.Add(runIdOverride!);
         }
         if (!string.IsNullOrWhiteSpace(request.ResultsDir))
         {
-            args.AddRange(new[] { "--results-dir", request.ResultsDir! });
+            args.Add("--results-dir");
+            args.Add(request.ResultsDir!);
         }
         if (!string.IsNullOrWhiteSpace(request.CondaEnv))
         {
-            args.AddRange(new[] { "--conda-env", request.CondaEnv! });
+            args.Add("--conda-env");
+            args.Add(request.CondaEnv!);
         }
         if (request.BasePort.HasValue)
         {
-            args.AddRange(new[] { "--base-port", request.BasePort.Value.ToString(CultureInfo.InvariantCulture) });
+            args.Add("--base-port");
+            args.Add(request.BasePort.Value.ToString(CultureInfo.InvariantCulture));
         }
         if (request.NoGraphics == true)
         {
@@ -424,6 +463,23 @@ internal sealed record ArchiveRunRequest(string? RunId, string? ResultsDir = nul
 internal sealed record DeleteRunRequest(string RunId, bool? Confirm = null, string? ResultsDir = null);
 internal sealed record ResumeFlagRequest(string RunId, bool ResumeOnStart, string? ResultsDir);
 internal sealed record StartTensorboardRequest(string? ResultsDir, string? RunId = null, string? CondaEnv = null, bool? SkipConda = null, int? Port = null);
+// Compile-time JSON metadata for request bodies and typed responses; anonymous payloads fall back to reflection.
+[JsonSourceGenerationOptions(JsonSerializerDefaults.Web)]
+[JsonSerializable(typeof(TrainingRequest))]
+[JsonSerializable(typeof(StopRunRequest))]
+[JsonSerializable(typeof(ResumeRunRequest))]
+[JsonSerializable(typeof(ArchiveRunRequest))]
+[JsonSerializable(typeof(DeleteRunRequest))]
+[JsonSerializable(typeof(ResumeFlagRequest))]
+[JsonSerializable(typeof(KillProcessRequest))]
+[JsonSerializable(typeof(TrainingStatusPayload))]
+[JsonSerializable(typeof(IReadOnlyList<TrainingStatusPayload>))]
+[JsonSerializable(typeof(ProcessStatusPayload))]
+[JsonSerializable(typeof(DashboardStatusPayload))]
+[JsonSerializable(typeof(KillProcessResult))]
+internal sealed partial class MentorApiJsonContext : JsonSerializerContext
+{
+}
 internal sealed record StartTensorboardResult(bool Started, bool AlreadyRunning, string? Url, string? Message);
 internal sealed record DashboardStatusPayload(bool Running, string Url, string? Message, string? RootDirectory, int Port, int? ProcessId);
 internal sealed record DashboardStartResult(bool Started, bool AlreadyRunning, string? Url, string? Message, int? ProcessId);
@@ -445,7 +501,7 @@ internal sealed record CurriculumState(string ParameterName, string? BehaviorNam
 internal sealed record QuickStatSummary(string Name, string Kind, long? Steps, double? DurationSeconds, double? MeanReward, double? RewardStdDev, double? BestReward, double? LastReward, int? CheckpointCount, double? LastCheckpointTime, CurriculumState? Curriculum);
 internal static class QuickStatReader
 {
-    private sealed record Checkpoint(long? Steps, double? Reward, double? CreationTime);
+    private readonly record struct Checkpoint(long? Steps, double? Reward, double? CreationTime);
 
     public static IReadOnlyList<QuickStatSummary> Build(string runId, string resultsDirectory)
     {
@@ -516,9 +572,9 @@ internal static class QuickStatReader
             double? durationSeconds = timeValues.Length > 1 ? timeValues.Max() - timeValues.Min() : null;
 
             var bestReward = rewardValues.Length > 0 ? rewardValues.Max() : (double?)null;
-            var last = checkpoints.OrderBy(c => c.CreationTime ?? 0).ThenBy(c => c.Steps ?? 0).LastOrDefault();
-            var lastReward = last?.Reward;
-            var lastTime = last?.CreationTime;
+            var last = checkpoints.OrderBy(c => c.CreationTime ?? 0).ThenBy(c => c.Steps ?? 0).Last();
+            var lastReward = last.Reward;
+            var lastTime = last.CreationTime;
 
             var curriculum = TryAttachCurriculum(curricula, kvp.Key, bestReward);
             var kind = curriculum is null ? "behavior" : "curriculum";
@@ -577,9 +633,9 @@ internal static class QuickStatReader
             foreach (var entry in checkpoints.OfType<JsonObject>())
             {
                 var cp = ToCheckpoint(entry);
-                if (cp is not null)
+                if (cp.HasValue)
                 {
-                    list.Add(cp);
+                    list.Add(cp.Value);
                 }
             }
         }
@@ -587,9 +643,9 @@ internal static class QuickStatReader
         if (behaviorNode["final_checkpoint"] is JsonObject finalCheckpoint)
         {
             var cp = ToCheckpoint(finalCheckpoint);
-            if (cp is not null)
+            if (cp.HasValue)
             {
-                list.Add(cp);
+                list.Add(cp.Value);
             }
         }
 
@@ -798,6 +854,14 @@ internal static class CurriculumConfigReader
 }
 internal sealed record TrainingStatusPayload(string RunId, string Status, bool Completed, int? ExitCode, string? ResultsDirectory, string? TrainingStatusPath, string? Message, string? TensorboardUrl, string? LogPath, IReadOnlyList<string>? LogTail, TrainingRunParameters? Parameters, bool ResumeOnStart, int? ProcessId = null, bool ProcessAlive = false, bool CanResume = false, IReadOnlyList<QuickStatSummary>? QuickStats = null)
 {
+    private static readonly Dictionary<string, string> CanonicalStatuses = new(StringComparer.OrdinalIgnoreCase)
+    {
+        ["success"] = "succeeded",
+        ["succeeded"] = "succeeded",
+        ["completed"] = "succeeded",
+        ["failure"] = "failed",
+        ["failed"] = "failed"
+    };
     public static TrainingStatusPayload FromFiles(string runId, string resultsDirectory)
     {
         var trainingStatusPath = TrainingRunStore.BuildTrainingStatusPath(resultsDirectory, runId);
@@ -817,7 +881,7 @@ internal sealed record TrainingStatusPayload(string RunId, string Status, bool C
         }
         if (File.Exists(trainingStatusPath))
         {
-            var statusText = TryReadStatus(trainingStatusPath);
+            var statusText = TrainingStatusFileReader.TryReadStatus(trainingStatusPath);
             var normalized = NormalizeStatus(statusText);
             return new TrainingStatusPayload(runId, normalized, Completed: true, ExitCode: null, resultsDirectory, trainingStatusPath, null, TensorboardUrl: null, LogPath: logPath, LogTail: logTail, Parameters: parameters, ResumeOnStart: resumeOnStart, ProcessId: processId, ProcessAlive: processAlive, CanResume: false, QuickStats: quickStats);
         }
@@ -833,15 +897,68 @@ internal sealed record TrainingStatusPayload(string RunId, string Status, bool C
     }
     private static string NormalizeStatus(string? status)
     {
-        return status?.ToLowerInvariant() switch { "success" => "succeeded", "succeeded" => "succeeded", "completed" => "succeeded", "failure" => "failed", "failed" => "failed", _ => status ?? "completed" };
+        if (status is null)
+        {
+            return "completed";
+        }
+        return CanonicalStatuses.TryGetValue(status, out var canonical) ? canonical : status;
+    }
+}
+internal static class TrainingStatusFileReader
+{
+    private const int MaxCachedEntries = 512;
+    private static ReadOnlySpan<byte> Utf8Bom => [0xEF, 0xBB, 0xBF];
+    private static readonly ConcurrentDictionary<string, CachedStatus> Cache = new(StringComparer.Ordinal);
+    private sealed record CachedStatus(long LastWriteTicks, long Length, string? Status);
+
+    // training_status.json only changes at checkpoints, so reuse the parsed status until its timestamp or size moves.
+    public static string? TryReadStatus(string path)
+    {
+        var file = new FileInfo(path);
+        if (!file.Exists)
+        {
+            Cache.TryRemove(path, out _);
+            return null;
+        }
+        var lastWriteTicks = file.LastWriteTimeUtc.Ticks;
+        var length = file.Length;
+        if (Cache.TryGetValue(path, out var cached) && cached.LastWriteTicks == lastWriteTicks && cached.Length == length)
+        {
+            return cached.Status;
+        }
+        var status = ParseStatus(path);
+        if (Cache.Count >= MaxCachedEntries)
+        {
+            Cache.Clear();
+        }
+        Cache[path] = new CachedStatus(lastWriteTicks, length, status);
+        return status;
     }
-    private static string? TryReadStatus(string path)
+    private static string? ParseStatus(string path)
     {
         try
         {
-            using var stream = File.OpenRead(path);
-            var node = JsonNode.Parse(stream);
-            return node?["status"]?.GetValue<string>();
+            var json = File.ReadAllBytes(path).AsSpan();
+            if (json.StartsWith(Utf8Bom))
+            {
+                json = json[Utf8Bom.Length..];
+            }
+            var reader = new Utf8JsonReader(json);
+            if (!reader.Read() || reader.TokenType != JsonTokenType.StartObject)
+            {
+                return null;
+            }
+            while (reader.Read() && reader.TokenType == JsonTokenType.PropertyName)
+            {
+                if (reader.ValueTextEquals("status"u8))
+                {
+                    reader.Read();
+                    return reader.TokenType == JsonTokenType.String ? reader.GetString() : null;
+                }
+                reader.Read();
+                reader.Skip();
+            }
+            return null;
         }
         catch
         {
@@ -1111,9 +1228,22 @@ internal sealed class TrainingRunStore
         "python3",
         "python3.exe"
     };
-    private readonly Dictionary<string, TrainingRunState> _runs = new();
+    private static readonly HashSet<string> CompletedStatuses = new(StringComparer.OrdinalIgnoreCase)
+    {
+        "succeeded",
+        "success",
+        "failed",
+        "failure",
+        "completed"
+    };
+    private static readonly Lazy<string> CondaExecutable = new(ResolveCondaExecutable);
+    // Reads are lock-free; _syncRoot still serializes starts and removals.
+    private readonly ConcurrentDictionary<string, TrainingRunState> _runs = new();
     private readonly Dictionary<string, TensorboardInstance> _tensorboards = new(StringComparer.OrdinalIgnoreCase);
+    private readonly ConcurrentDictionary<string, Lazy<TrainingStatusPayload>> _pendingStatusReads = new(StringComparer.Ordinal);
     private readonly object _syncRoot = new();
+    private static ResolvedDirectory? _resolvedDefaultResultsDirectory;
+    private sealed record ResolvedDirectory(string Source, string FullPath);
     private sealed record TensorboardInstance(Process Process, string ResultsDirectory, string? RunId, int Port);
     internal sealed record LogReadResult(bool Found, string? LogPath, string Content, long From, long To, long Size, bool EndOfFile, string? Error)
     {
@@ -1145,10 +1275,7 @@ internal sealed class TrainingRunStore
         }
 
         TrainingRunState? run;
-        lock (_syncRoot)
-        {
-            _runs.TryGetValue(runId, out run);
-        }
+        _runs.TryGetValue(runId, out run);
 
         if (run is null)
         {
@@ -1182,7 +1309,7 @@ internal sealed class TrainingRunStore
         run.RequestStop();
         return StopRunResult.Stopping($"Stop requested for '{runId}'. Training will exit and can be resumed.");
     }
-    public ArchiveRunResult ArchiveRun(string runId, string? resultsDirOverride)
+    public async Task<ArchiveRunResult> ArchiveRunAsync(string runId, string? resultsDirOverride)
     {
         if (string.IsNullOrWhiteSpace(runId))
         {
@@ -1190,10 +1317,7 @@ internal sealed class TrainingRunStore
         }
 
         TrainingRunState? tracked;
-        lock (_syncRoot)
-        {
-            _runs.TryGetValue(runId, out tracked);
-        }
+        _runs.TryGetValue(runId, out tracked);
 
         if (tracked is not null && !tracked.IsCompleted)
         {
@@ -1215,7 +1339,7 @@ internal sealed class TrainingRunStore
             return new ArchiveRunResult(false, $"Archive target already exists at '{destination}'.", null);
         }
 
-        var stopResult = StopTensorboardForRun(runDirectory);
+        var stopResult = await StopTensorboardForRunAsync(runDirectory).ConfigureAwait(false);
         if (stopResult.Status == StopTensorboardStatus.Failed)
         {
             return new ArchiveRunResult(false, stopResult.Message ?? "Unable to stop TensorBoard for this run.", null);
@@ -1238,12 +1362,12 @@ internal sealed class TrainingRunStore
 
         lock (_syncRoot)
         {
-            _runs.Remove(runId);
+            _runs.TryRemove(runId, out _);
         }
 
         return new ArchiveRunResult(true, null, destination);
     }
-    public DeleteRunResult DeleteRun(DeleteRunRequest request)
+    public async Task<DeleteRunResult> DeleteRunAsync(DeleteRunRequest request)
     {
         if (request is null || string.IsNullOrWhiteSpace(request.RunId))
         {
@@ -1257,10 +1381,7 @@ internal sealed class TrainingRunStore
 
         var runId = request.RunId.Trim();
         TrainingRunState? tracked;
-        lock (_syncRoot)
-        {
-            _runs.TryGetValue(runId, out tracked);
-        }
+        _runs.TryGetValue(runId, out tracked);
 
         var resultsDir = ResolveResultsDirectory(tracked?.ResultsDirectory ?? request.ResultsDir);
         var normalizedResultsDir = NormalizeDirectoryPath(resultsDir);
@@ -1270,7 +1391,7 @@ internal sealed class TrainingRunStore
             return DeleteRunResult.NotFound($"Run '{runId}' not found at '{runDirectory}'.");
         }
 
-        var stopResult = StopTensorboardForRun(runDirectory);
+        var stopResult = await StopTensorboardForRunAsync(runDirectory).ConfigureAwait(false);
         if (stopResult.Status == StopTensorboardStatus.Failed)
         {
             return DeleteRunResult.Failed(stopResult.Message ?? "Unable to stop TensorBoard for this run.");
@@ -1282,7 +1403,7 @@ internal sealed class TrainingRunStore
             tracked.Cancel();
             try
             {
-                Task.WaitAny(tracked.RunTask, Task.Delay(TimeSpan.FromSeconds(5)));
+                await Task.WhenAny(tracked.RunTask, Task.Delay(TimeSpan.FromSeconds(5))).ConfigureAwait(false);
             }
             catch
             {
@@ -1292,7 +1413,7 @@ internal sealed class TrainingRunStore
         else
         {
             var metadata = TrainingRunMetadata.TryLoad(runDirectory);
-            TryTerminateKnownTrainingProcess(metadata?.ProcessId, warnings);
+            await TryTerminateKnownTrainingProcessAsync(metadata?.ProcessId, warnings).ConfigureAwait(false);
         }
 
         try
@@ -1306,7 +1427,7 @@ internal sealed class TrainingRunStore
 
         lock (_syncRoot)
         {
-            _runs.Remove(runId);
+            _runs.TryRemove(runId, out _);
         }
 
         var message = warnings.Count > 0 ? string.Join(" | ", warnings) : null;
@@ -1385,24 +1506,26 @@ internal sealed class TrainingRunStore
     public TrainingStatusPayload GetStatus(string runId, string? resultsDirOverride)
     {
         TrainingRunState? tracked;
-        lock (_syncRoot)
-        {
-            _runs.TryGetValue(runId, out tracked);
-        }
+        _runs.TryGetValue(runId, out tracked);
         if (tracked is not null)
         {
             return tracked.ToPayload();
         }
         var resultsDir = ResolveResultsDirectory(resultsDirOverride);
-        return TrainingStatusPayload.FromFiles(runId, resultsDir);
+        var key = $"{resultsDir}|{runId}";
+        var pending = _pendingStatusReads.GetOrAdd(key, _ => new Lazy<TrainingStatusPayload>(() => TrainingStatusPayload.FromFiles(runId, resultsDir)));
+        try
+        {
+            return pending.Value;
+        }
+        finally
+        {
+            _pendingStatusReads.TryRemove(new KeyValuePair<string, Lazy<TrainingStatusPayload>>(key, pending));
+        }
     }
     public IReadOnlyList<TrainingStatusPayload> ListRuns(string? resultsDirOverride = null)
     {
-        List<TrainingRunState> tracked;
-        lock (_syncRoot)
-        {
-            tracked = _runs.Values.ToList();
-        }
+        var tracked = _runs.Values.ToList();
         // Start with any in-memory runs (running or finished) so we return the latest task state.
         var payloads = tracked.Select(run => run.ToPayload()).ToList();
         var resultsDir = ResolveResultsDirectory(resultsDirOverride);
@@ -1413,7 +1536,7 @@ internal sealed class TrainingRunStore
             var payload = payloads[i];
             var payloadResultsDir = ResolveResultsDirectory(payload.ResultsDirectory ?? resultsDir);
             var statusPath = BuildTrainingStatusPath(payloadResultsDir, payload.RunId);
-            var status = TryReadStatusFromFile(statusPath);
+            var status = TrainingStatusFileReader.TryReadStatus(statusPath);
             var completedFromDisk = IsCompletedStatus(status) || (File.Exists(statusPath) && status is null);
             if (completedFromDisk)
             {
@@ -1443,7 +1566,7 @@ internal sealed class TrainingRunStore
         }
         return payloads;
     }
-    public StartTensorboardResult StartTensorboard(StartTensorboardRequest request)
+    public async Task<StartTensorboardResult> StartTensorboardAsync(StartTensorboardRequest request)
     {
         var rawResultsDir = string.IsNullOrWhiteSpace(request.ResultsDir) ? TrainingOptions.DefaultResultsDirectory : request.ResultsDir;
         var resultsDir = ResolveResultsDirectory(rawResultsDir);
@@ -1496,7 +1619,7 @@ internal sealed class TrainingRunStore
                 return new StartTensorboardResult(false, false, null, "Failed to start TensorBoard process.");
             }
 
-            var earlyExitMessage = ObserveEarlyTensorboardExit(process);
+            var earlyExitMessage = await ObserveEarlyTensorboardExitAsync(process).ConfigureAwait(false);
             if (earlyExitMessage is not null)
             {
                 SafeDispose(process);
@@ -1515,9 +1638,10 @@ internal sealed class TrainingRunStore
             return new StartTensorboardResult(false, false, null, ex.Message);
         }
     }
-    private StopTensorboardResult StopTensorboardForRun(string runDirectory)
+    private async Task<StopTensorboardResult> StopTensorboardForRunAsync(string runDirectory)
     {
         var normalizedRunDir = NormalizeDirectoryPath(runDirectory);
+        Process? stopping = null;
 
         lock (_syncRoot)
         {
@@ -1536,23 +1660,41 @@ internal sealed class TrainingRunStore
                     if (!process.HasExited)
                     {
                         process.Kill(entireProcessTree: true);
-                        process.WaitForExit(TimeSpan.FromSeconds(5));
                     }
                 }
                 catch (Exception ex)
                 {
-                    return StopTensorboardResult.Failed($"Unable to stop TensorBoard (PID {process.Id}): {ex.Message}");
-                }
-                finally
-                {
+                    var failure = StopTensorboardResult.Failed($"Unable to stop TensorBoard (PID {process.Id}): {ex.Message}");
                     RemoveTensorboard_NoLock(kvp.Key, process);
+                    return failure;
                 }
 
-                return StopTensorboardResult.Stopped();
+                // Untrack without disposing so the exit can be awaited once the lock is released.
+                _tensorboards.Remove(kvp.Key);
+                stopping = process;
+                break;
             }
         }
 
-        return StopTensorboardResult.NotTracked("TensorBoard for this run is not managed by mentor-api. Stop it manually and retry.");
+        if (stopping is null)
+        {
+            return StopTensorboardResult.NotTracked("TensorBoard for this run is not managed by mentor-api. Stop it manually and retry.");
+        }
+
+        try
+        {
+            await WaitForKilledProcessAsync(stopping).ConfigureAwait(false);
+        }
+        catch (Exception ex)
+        {
+            return StopTensorboardResult.Failed($"Unable to stop TensorBoard (PID {stopping.Id}): {ex.Message}");
+        }
+        finally
+        {
+            SafeDispose(stopping);
+        }
+
+        return StopTensorboardResult.Stopped();
     }
     public IReadOnlyList<string> ResumeUnfinishedRuns(Action<string>? log = null, string? resultsDirOverride = null)
     {
@@ -1565,6 +1707,9 @@ internal sealed class TrainingRunStore
             log?.Invoke(msg);
             return messages;
         }
+        var completedIndex = CompletedRunIndex.Load(resultsDir);
+        var refreshedIndex = new Dictionary<string, CompletedRunIndexEntry>(StringComparer.Ordinal);
+        var indexChanged = false;
         foreach (var runDirectory in Directory.EnumerateDirectories(resultsDir))
         {
             if (IsArchiveDirectory(runDirectory))
@@ -1573,9 +1718,17 @@ internal sealed class TrainingRunStore
             }
             var runId = Path.GetFileName(runDirectory);
             var statusPath = BuildTrainingStatusPath(resultsDir, runId);
-            var status = TryReadStatusFromFile(statusPath);
+            var statusLastWriteTicks = File.GetLastWriteTimeUtc(statusPath).Ticks;
+            if (completedIndex.TryGetValue(runId, out var indexed) && indexed.StatusLastWriteTicks == statusLastWriteTicks)
+            {
+                refreshedIndex[runId] = indexed;
+                continue;
+            }
+            var status = TrainingStatusFileReader.TryReadStatus(statusPath);
             if (IsCompletedStatus(status))
             {
+                refreshedIndex[runId] = new CompletedRunIndexEntry(status, statusLastWriteTicks);
+                indexChanged = true;
                 continue;
             }
             var metadata = TrainingRunMetadata.TryLoad(runDirectory);
@@ -1636,29 +1789,15 @@ internal sealed class TrainingRunStore
                 log?.Invoke(conflict);
             }
         }
+        if (indexChanged || refreshedIndex.Count != completedIndex.Count)
+        {
+            CompletedRunIndex.Save(resultsDir, refreshedIndex);
+        }
         return messages;
     }
     private static bool IsCompletedStatus(string? status)
     {
-        var normalized = status?.ToLowerInvariant();
-        return normalized is "succeeded" or "success" or "failed" or "failure" or "completed";
-    }
-    private static string? TryReadStatusFromFile(string path)
-    {
-        if (!File.Exists(path))
-        {
-            return null;
-        }
-        try
-        {
-            using var stream = File.OpenRead(path);
-            var node = JsonNode.Parse(stream);
-            return node?["status"]?.GetValue<string>();
-        }
-        catch
-        {
-            return null;
-        }
+        return status is not null && CompletedStatuses.Contains(status);
     }
     private TrainingOptions? ResolveBasePort(TrainingOptions options, out string? message)
     {
@@ -1726,7 +1865,7 @@ internal sealed class TrainingRunStore
         }
         else
         {
-            startInfo.FileName = ResolveCondaExecutable();
+            startInfo.FileName = CondaExecutable.Value;
             startInfo.ArgumentList.Add("run");
             startInfo.ArgumentList.Add("--live-stream");
             startInfo.ArgumentList.Add("-n");
@@ -1797,40 +1936,38 @@ internal sealed class TrainingRunStore
             return new HashSet<int>();
         }
     }
-    private static string? ObserveEarlyTensorboardExit(Process process, int waitMilliseconds = 3000)
+    private static async Task<string?> ObserveEarlyTensorboardExitAsync(Process process, int waitMilliseconds = 3000)
     {
-        var waited = 0;
-        while (waited < waitMilliseconds)
+        using var timeout = new CancellationTokenSource(waitMilliseconds);
+        try
         {
-            var slice = Math.Min(500, waitMilliseconds - waited);
-            if (process.WaitForExit(slice))
-            {
-                var stderr = string.Empty;
-                var stdout = string.Empty;
-                try
-                {
-                    stderr = process.StandardError.ReadToEnd();
-                    stdout = process.StandardOutput.ReadToEnd();
-                }
-                catch
-                {
-                    // ignore read failures
-                }
-
-                var message = $"TensorBoard exited immediately with code {process.ExitCode}.";
-                var tail = string.Join(" ", new[] { stdout, stderr }.Where(s => !string.IsNullOrWhiteSpace(s)).Select(s => s.Trim()));
-                if (!string.IsNullOrWhiteSpace(tail))
-                {
-                    message += " Output: " + tail;
-                }
+            await process.WaitForExitAsync(timeout.Token).ConfigureAwait(false);
+        }
+        catch (OperationCanceledException)
+        {
+            return null;
+        }
 
-                return message;
-            }
+        var stderr = string.Empty;
+        var stdout = string.Empty;
+        try
+        {
+            stderr = await process.StandardError.ReadToEndAsync().ConfigureAwait(false);
+            stdout = await process.StandardOutput.ReadToEndAsync().ConfigureAwait(false);
+        }
+        catch
+        {
+            // ignore read failures
+        }
 
-            waited += slice;
+        var message = $"TensorBoard exited immediately with code {process.ExitCode}.";
+        var tail = string.Join(" ", new[] { stdout, stderr }.Where(s => !string.IsNullOrWhiteSpace(s)).Select(s => s.Trim()));
+        if (!string.IsNullOrWhiteSpace(tail))
+        {
+            message += " Output: " + tail;
         }
 
-        return null;
+        return message;
     }
     private void RegisterTensorboard_NoLock(Process process, string resultsDir, string? runId, int port)
     {
@@ -1903,7 +2040,7 @@ internal sealed class TrainingRunStore
             || (!string.IsNullOrWhiteSpace(name) && name.EndsWith(ArchiveRootSuffix, StringComparison.OrdinalIgnoreCase));
     }
 
-    private void TryTerminateKnownTrainingProcess(int? pid, List<string> warnings)
+    private static async Task TryTerminateKnownTrainingProcessAsync(int? pid, List<string> warnings)
     {
         if (!pid.HasValue || pid.Value <= 0 || warnings is null)
         {
@@ -1926,7 +2063,7 @@ internal sealed class TrainingRunStore
             }
 
             process.Kill(entireProcessTree: true);
-            process.WaitForExit(TimeSpan.FromSeconds(5));
+            await WaitForKilledProcessAsync(process).ConfigureAwait(false);
         }
         catch (Exception ex)
         {
@@ -1934,6 +2071,19 @@ internal sealed class TrainingRunStore
         }
     }
 
+    private static async Task WaitForKilledProcessAsync(Process process)
+    {
+        using var timeout = new CancellationTokenSource(TimeSpan.FromSeconds(5));
+        try
+        {
+            await process.WaitForExitAsync(timeout.Token).ConfigureAwait(false);
+        }
+        catch (OperationCanceledException)
+        {
+            // give up after 5 s, as the blocking wait did
+        }
+    }
+
     internal static bool IsKnownTrainingProcessAlive(int? pid)
     {
         if (!pid.HasValue || pid.Value <= 0)
@@ -2004,14 +2154,23 @@ internal sealed class TrainingRunStore
                 return resultsDirOverride;
             }
         }
+        var defaultDirectory = TrainingOptions.DefaultResultsDirectory;
+        var cached = _resolvedDefaultResultsDirectory;
+        if (cached is not null && string.Equals(cached.Source, defaultDirectory, StringComparison.Ordinal))
+        {
+            return cached.FullPath;
+        }
+        string fullPath;
         try
         {
-            return Path.GetFullPath(TrainingOptions.DefaultResultsDirectory);
+            fullPath = Path.GetFullPath(defaultDirectory);
         }
         catch
         {
-            return TrainingOptions.DefaultResultsDirectory;
+            fullPath = defaultDirectory;
         }
+        _resolvedDefaultResultsDirectory = new ResolvedDirectory(defaultDirectory, fullPath);
+        return fullPath;
     }
     internal static TrainingRunParameters? BuildParametersFromOptions(TrainingOptions? options)
     {
@@ -2040,10 +2199,7 @@ internal sealed class TrainingRunStore
 
         var normalizedRunId = runId.Trim();
         TrainingRunState? tracked = null;
-        lock (_syncRoot)
-        {
-            _runs.TryGetValue(normalizedRunId, out tracked);
-        }
+        _runs.TryGetValue(normalizedRunId, out tracked);
 
         var resultsDir = ResolveResultsDirectory(resultsDirOverride ?? tracked?.ResultsDirectory);
         var logPath = BuildLogPath(resultsDir, normalizedRunId);
@@ -2150,9 +2306,8 @@ internal sealed class TrainingRunState
         Directory.CreateDirectory(runLogsDirectory);
         TrainingRunMetadata.Save(runDirectory, options);
         var logPath = Path.Combine(runLogsDirectory, "mentor-api.log");
-        var outputStream = new FileStream(logPath, FileMode.Append, FileAccess.Write, FileShare.ReadWrite);
-        var outputWriter = new StreamWriter(outputStream)
-        { AutoFlush = true };
+        var outputStream = new FileStream(logPath, FileMode.Append, FileAccess.Write, FileShare.ReadWrite, TrainingSessionRunner.OutputBufferSize);
+        var outputWriter = new StreamWriter(outputStream);
         var runner = new TrainingSessionRunner(
             options,
             outputWriter,
@@ -2265,6 +2420,7 @@ internal sealed class TrainingRunState
 internal sealed record TrainingRunMetadata(string? EnvPath, string ConfigPath, string RunId, string ResultsDirectory, string CondaEnvironmentName, int? BasePort, bool NoGraphics, bool SkipConda, bool LaunchTensorboard, bool ResumeOnStart = false, int? ProcessId = null, bool StopRequested = false, bool Resume = false)
 {
     private const string MetadataFileName = "run_metadata.json";
+    private static readonly JsonSerializerOptions SerializerOptions = new() { WriteIndented = true };
     public static void Save(string runDirectory, TrainingOptions options)
     {
         var existing = TryLoad(runDirectory);
@@ -2275,8 +2431,8 @@ internal sealed record TrainingRunMetadata(string? EnvPath, string ConfigPath, s
     {
         var metadataPath = BuildMetadataPath(runDirectory);
         Directory.CreateDirectory(Path.GetDirectoryName(metadataPath)!);
-        var json = JsonSerializer.Serialize(metadata, new JsonSerializerOptions { WriteIndented = true });
-        File.WriteAllText(metadataPath, json);
+        var json = JsonSerializer.SerializeToUtf8Bytes(metadata, SerializerOptions);
+        File.WriteAllBytes(metadataPath, json);
     }
     public static TrainingRunMetadata? TryLoad(string runDirectory)
     {
@@ -2287,8 +2443,9 @@ internal sealed record TrainingRunMetadata(string? EnvPath, string ConfigPath, s
         }
         try
         {
-            var json = File.ReadAllText(metadataPath);
-            return JsonSerializer.Deserialize<TrainingRunMetadata>(json);
+            // The Stream overload skips a UTF-8 BOM, which files written through the /files bridge carry.
+            using var stream = File.OpenRead(metadataPath);
+            return JsonSerializer.Deserialize<TrainingRunMetadata>(stream);
         }
         catch
         {
@@ -2304,6 +2461,47 @@ internal sealed record TrainingRunMetadata(string? EnvPath, string ConfigPath, s
         return Path.Combine(runDirectory, "run_logs", MetadataFileName);
     }
 }
+internal sealed record CompletedRunIndexEntry(string? Status, long StatusLastWriteTicks);
+internal static class CompletedRunIndex
+{
+    private const string IndexFileName = ".mentor_index.json";
+    private static readonly JsonSerializerOptions SerializerOptions = new() { WriteIndented = true };
+    public static Dictionary<string, CompletedRunIndexEntry> Load(string resultsDirectory)
+    {
+        var indexPath = Path.Combine(resultsDirectory, IndexFileName);
+        if (!File.Exists(indexPath))
+        {
+            return new Dictionary<string, CompletedRunIndexEntry>(StringComparer.Ordinal);
+        }
+        try
+        {
+            using var stream = File.OpenRead(indexPath);
+            var entries = JsonSerializer.Deserialize<Dictionary<string, CompletedRunIndexEntry>>(stream);
+            return entries is null
+                ? new Dictionary<string, CompletedRunIndexEntry>(StringComparer.Ordinal)
+                : new Dictionary<string, CompletedRunIndexEntry>(entries, StringComparer.Ordinal);
+        }
+        catch
+        {
+            return new Dictionary<string, CompletedRunIndexEntry>(StringComparer.Ordinal);
+        }
+    }
+    public static void Save(string resultsDirectory, Dictionary<string, CompletedRunIndexEntry> entries)
+    {
+        var indexPath = Path.Combine(resultsDirectory, IndexFileName);
+        var tempPath = indexPath + ".tmp";
+        try
+        {
+            // Replace the index in one step so a crash mid-write never leaves a truncated file behind.
+            File.WriteAllBytes(tempPath, JsonSerializer.SerializeToUtf8Bytes(entries, SerializerOptions));
+            File.Move(tempPath, indexPath, overwrite: true);
+        }
+        catch
+        {
+            // Best-effort; the next startup falls back to reading each status file.
+        }
+    }
+}
 internal sealed record TrainingRunOutcome(int? ExitCode, Exception? Error)
 {
     public bool IsSuccess => Error is null && ExitCode.GetValueOrDefault() == 0;